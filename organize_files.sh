@@ -74,9 +74,21 @@ mkdir -p "$ORGANIZED_DIR/other"
 
 # Process Files
 
+# Count files up front so progress can be reported as "PROGRESS <done>/<total>"
+total=0
+for file in "$SOURCE_DIR"/*; do
+    if [ -e "$file" ]; then
+        total=$((total + 1))
+    fi
+done
+done_count=0
+
 for file in "$SOURCE_DIR"/*; do
     [ -e "$file" ] || continue
 
+    echo "PROGRESS $done_count/$total"
+    done_count=$((done_count + 1))
+
     filename=$(basename "$file")
     extension="${filename##*.}"
 
@@ -120,6 +132,7 @@ for file in "$SOURCE_DIR"/*; do
         continue
     fi
 done
+echo "PROGRESS $total/$total"
 
 
 # Apply Permissions (Option A)
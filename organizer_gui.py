@@ -6,88 +6,390 @@ Run: python3 organizer_gui.py
 This GUI calls your existing Bash scripts:
  - ./organize_files.sh <source_dir> <organized_dir>
  - ./verify_integrity.sh <organized_dir>
+(or, optionally, a built-in multi-process Python verifier for the checksum log)
 
 It streams stdout/stderr to the GUI, shows progress and logs, and lets you restore backups.
 
-Requires: Pillow (for icon)
+Requires: Pillow (for icon; only the first launch, the resized icon is cached as PNG)
+Optional: watchdog (event-driven live logs; falls back to polling)
 """
 
 import os
+import re
 import sys
+import codecs
 import threading
 import queue
 import subprocess
 import time
+import stat
 import shutil
 import zipfile
+import heapq
+import hashlib
+import multiprocessing
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 
 try:
-    from PIL import Image, ImageTk
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
 except Exception:
-    Image = None
-    ImageTk = None
+    Observer = None
+    FileSystemEventHandler = object
 
 # === CONFIG ===
 # Path to icon image uploaded earlier — change if needed
 ICON_PATH = "/mnt/data/2AF29F5A-0994-4BE9-91A5-B81724D7B6A2.jpeg"
+# Resized copy of the icon, loaded without Pillow on later launches
+ICON_CACHE = Path(__file__).resolve().parent / "icon_64.png"
 
 # Default scripts (relative to GUI script directory)
 BASE_DIR = Path.cwd()
 ORGANIZE_SCRIPT = BASE_DIR / "organize_files.sh"
 VERIFY_SCRIPT = BASE_DIR / "verify_integrity.sh"
 
-# Poll interval for log viewer (ms)
+# Poll interval for log viewer (ms), used when watchdog is not installed
 LOG_POLL_MS = 2000
 
-# Helper: run subprocess and stream output to a queue
-def run_process(cmd_list, out_queue):
+# Output streams are flushed once this much is pending or this long has passed
+FLUSH_BYTES = 16 * 1024
+FLUSH_INTERVAL = 0.1  # seconds
+
+# Scrollback cap per output stream (lines); trimmed down to TEXT_KEEP_LINES
+TEXT_MAX_LINES = 20000
+TEXT_KEEP_LINES = 15000
+
+# Output streams sharing one Text widget; each is a tag, hidden via elide when its tab isn't shown
+OUTPUT_TAGS = ("organizer", "integrity", "logs")
+
+# Backups listing: accepted archive suffixes and max entries shown (newest first)
+ZIP_SUFFIXES = (".zip", ".ZIP", ".Zip")
+BACKUP_LIST_LIMIT = 500
+
+# Scripts may print "PROGRESS <done>/<total>" lines to drive a determinate progress bar
+PROGRESS_RE = re.compile(r"^PROGRESS (\d+)/(\d+)\r?(?:\n|\Z)", re.M)
+# Indeterminate animation step (ms) until the first PROGRESS line arrives
+PROGRESS_IDLE_MS = 250
+
+# Read size for subprocess output pipes
+PIPE_CHUNK = 65536
+
+# Copy buffer for extracting backup members
+RESTORE_CHUNK = 1 << 20
+
+# Python verifier: read size when hashing, checksum log entries per worker task
+HASH_CHUNK = 1 << 20
+VERIFY_BATCH = 64
+
+# Helper: a selected directory, stat()ed once when chosen rather than on every action
+@dataclass
+class DirState:
+    path: str
+    exists: bool
+
+    @classmethod
+    def probe(cls, path):
+        try:
+            st = os.stat(path)
+        except OSError:
+            return cls(path, False)
+        return cls(path, stat.S_ISDIR(st.st_mode))
+
+# Helper: single-producer/single-consumer byte ring buffer
+class SPSCByteRing:
     """
-    Runs subprocess and pushes output lines to out_queue.
+    Fixed-capacity byte ring shared by one producer thread and one consumer
+    (the Tk main loop). head is only advanced by the consumer and tail only
+    by the producer, so no lock is needed under the GIL.
+    """
+    def __init__(self, cap=1 << 20):
+        self.buf = bytearray(cap)
+        self.cap = cap
+        self.head = 0
+        self.tail = 0
+
+    def push(self, data):
+        """Append bytes, waiting for the consumer if the ring is full."""
+        mv = memoryview(data)
+        while mv:
+            free = self.cap - (self.tail - self.head)
+            if not free:
+                time.sleep(0.005)
+                continue
+            n = min(free, len(mv))
+            pos = self.tail % self.cap
+            first = min(n, self.cap - pos)
+            self.buf[pos:pos + first] = mv[:first]
+            if n > first:
+                self.buf[:n - first] = mv[first:n]
+            self.tail += n
+            mv = mv[n:]
+
+    def drain(self):
+        """Return and clear all bytes currently available."""
+        tail = self.tail
+        n = tail - self.head
+        if not n:
+            return b""
+        pos = self.head % self.cap
+        first = min(n, self.cap - pos)
+        out = bytes(self.buf[pos:pos + first])
+        if n > first:
+            out += bytes(self.buf[:n - first])
+        self.head = tail
+        return out
+
+# Helper: start a script with stdout+stderr on one binary pipe
+def spawn_process(cmd_list):
+    """
+    Keeps the spawn on CPython's fast path: an argv list (no shell), no
+    preexec_fn and no new session. close_fds stays on; Linux 5.9+ closes
+    inherited fds with a single close_range() call, and Python 3.13+ can
+    then still use posix_spawn instead of fork+exec.
+    """
+    return subprocess.Popen(
+        cmd_list,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        bufsize=0,
+        close_fds=True,
+        start_new_session=False,
+    )
+
+# Helper: run subprocess and stream output to a ring buffer
+def run_process(cmd_list, ring):
+    """
+    Runs subprocess and pushes raw output bytes to ring in PIPE_CHUNK reads.
     Returns process return code.
     """
     try:
-        proc = subprocess.Popen(
-            cmd_list,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            bufsize=1,
-            universal_newlines=True,
-        )
-    except FileNotFoundError as e:
-        out_queue.put(f"[ERROR] Script not found: {cmd_list[0]}\n{e}\n")
+        proc = spawn_process(cmd_list)
+    except OSError as e:
+        # missing script, or not executable (PermissionError)
+        ring.push(f"[ERROR] Could not start script: {cmd_list[0]}\n{e}\n".encode())
         return 127
 
-    # stream output
+    # stream output in chunks
     try:
-        for line in proc.stdout:
-            out_queue.put(line)
+        fd = proc.stdout.fileno()
+        while True:
+            chunk = os.read(fd, PIPE_CHUNK)
+            if not chunk:
+                break
+            ring.push(chunk)
         proc.stdout.close()
         proc.wait()
         return proc.returncode
     except Exception as e:
-        out_queue.put(f"[ERROR] Running command failed: {e}\n")
+        ring.push(f"[ERROR] Running command failed: {e}\n".encode())
         return 1
+# Helper: parse a sha256sum-style checksum log into (digest, path) pairs
+def read_checksum_log(log_path):
+    """
+    Returns (entries, bad) where bad counts non-blank lines that could not
+    be parsed, like sha256sum -c's "improperly formatted" lines.
+    """
+    entries = []
+    bad = 0
+    with open(log_path, 'r', encoding='utf-8', errors='surrogateescape') as fh:
+        for line in fh:
+            line = line.rstrip("\n")
+            if not line:
+                continue
+            # sha256sum escapes names containing a backslash or newline and prefixes the line with a backslash
+            escaped = line.startswith("\\")
+            if escaped:
+                line = line[1:]
+            digest, sep, path = line.partition(" ")
+            if not sep or not re.fullmatch(r"[0-9a-fA-F]{64}", digest) or not path:
+                bad += 1
+                continue
+            if path[:1] in (" ", "*"):
+                path = path[1:]
+            if escaped:
+                path = path.replace("\\\\", "\0").replace("\\n", "\n").replace("\0", "\\")
+            entries.append((digest.lower(), path))
+    return entries, bad
+
+# Helper: worker-process task, hashes a batch of checksum log entries
+def hash_batch(entries):
+    """
+    Returns a list of (path, status) where status is "OK", "FAILED" or
+    "FAILED open or read", matching sha256sum -c wording.
+    """
+    results = []
+    for digest, path in entries:
+        h = hashlib.sha256()
+        try:
+            with open(path, 'rb') as fh:
+                while True:
+                    chunk = fh.read(HASH_CHUNK)
+                    if not chunk:
+                        break
+                    h.update(chunk)
+        except OSError:
+            results.append((path, "FAILED open or read"))
+            continue
+        results.append((path, "OK" if h.hexdigest() == digest else "FAILED"))
+    return results
+
+# Helper: verify a checksum log across a process pool, streaming to a ring buffer
+def verify_checksums(organized_dir, ring):
+    """
+    Verifies organized_files_checksum.log in organized_dir and appends the
+    results to integrity_check.log. Returns 0 if every file matches, else 1.
+    """
+    checksum_log = os.path.join(organized_dir, "organized_files_checksum.log")
+    log_file = os.path.join(organized_dir, "integrity_check.log")
+    try:
+        entries, bad = read_checksum_log(checksum_log)
+    except OSError as e:
+        ring.push(f"[ERROR] Checksum log not found at: {checksum_log}\n{e}\n".encode())
+        return 1
+
+    with open(log_file, 'a', encoding='utf-8', errors='surrogateescape') as log:
+        def emit(msg):
+            log.write(msg)
+            log.flush()
+            ring.push(msg.encode('utf-8', errors='surrogateescape'))
+
+        def stamp(msg):
+            emit(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] {msg}\n")
+
+        stamp("[INFO] Verifying file integrity (Python verifier)...")
+        stamp(f"[INFO] Using checksum log: {checksum_log}")
+        if bad:
+            emit(f"WARNING: {bad} line{' is' if bad == 1 else 's are'} improperly formatted\n")
+        if not entries:
+            # an empty or corrupted manifest must never pass
+            emit(f"{checksum_log}: no properly formatted checksum lines found\n")
+            stamp("[WARNING] Integrity check failed! Checksum log has no valid entries.")
+            stamp("[INFO] Verification complete.")
+            return 1
+        failed = 0
+        batches = [entries[i:i + VERIFY_BATCH] for i in range(0, len(entries), VERIFY_BATCH)]
+        if batches:
+            # spawn, not fork: the parent is a threaded Tk process
+            ctx = multiprocessing.get_context("spawn")
+            workers = min(os.cpu_count() or 1, len(batches))
+            with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+                futures = [pool.submit(hash_batch, b) for b in batches]
+                checked = 0
+                for fut in as_completed(futures):
+                    lines = []
+                    for path, status in fut.result():
+                        if status != "OK":
+                            failed += 1
+                        lines.append(f"{path}: {status}\n")
+                    emit("".join(lines))
+                    checked += len(lines)
+                    # GUI-only, not written to integrity_check.log
+                    ring.push(f"PROGRESS {checked}/{len(entries)}\n".encode())
+        if failed:
+            stamp(f"[WARNING] Integrity check failed! {failed} file(s) missing or modified.")
+        else:
+            stamp("[INFO] Integrity OK. All files are unchanged.")
+        stamp("[INFO] Verification complete.")
+    return 1 if failed else 0
+
+# Helper: map a zip member name to its path under root, cleaned the way zipfile.extract does
+def member_target(info, root):
+    """
+    Strips drive letters, leading "/" and "." / ".." parts (and, on Windows,
+    characters illegal in file names) from info.filename, then joins it to
+    root, which must already be a realpath. Returns None for members that
+    clean to nothing. Raises ValueError if the result still resolves outside
+    root (e.g. through a symlink already in root).
+    """
+    arcname = info.filename.replace('/', os.path.sep)
+    if os.path.altsep:
+        arcname = arcname.replace(os.path.altsep, os.path.sep)
+    arcname = os.path.splitdrive(arcname)[1]
+    parts = [x for x in arcname.split(os.path.sep) if x not in ('', os.path.curdir, os.path.pardir)]
+    if os.path.sep == '\\':
+        table = str.maketrans(':<>|"?*', '_______')
+        parts = [x.translate(table).rstrip('.') for x in parts]
+        parts = [x for x in parts if x]
+    if not parts:
+        return None
+    target = os.path.join(root, *parts)
+    if os.path.commonpath([root, os.path.realpath(target)]) != root:
+        raise ValueError(f"Unsafe path in archive: {info.filename}")
+    return target
+
+# Helper: extract one zip member with a large copy buffer
+def extract_member(z, info, target):
+    """
+    Extracts info from z to target (see member_target), streaming through
+    RESTORE_CHUNK-sized reads.
+    """
+    if info.is_dir():
+        os.makedirs(target, exist_ok=True)
+        return
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    with z.open(info) as src, open(target, 'wb') as dst:
+        shutil.copyfileobj(src, dst, RESTORE_CHUNK)
+
+# Helper: load the window icon, resizing with Pillow only when the cache is stale
+def load_icon(master):
+    """
+    Returns a PhotoImage for ICON_PATH (64x64), or None if unavailable.
+    """
+    try:
+        src_mtime = os.stat(ICON_PATH).st_mtime
+    except OSError:
+        return None
+    try:
+        if ICON_CACHE.stat().st_mtime >= src_mtime:
+            return tk.PhotoImage(master=master, file=str(ICON_CACHE))
+    except (OSError, tk.TclError):
+        pass
+    try:
+        from PIL import Image, ImageTk
+    except Exception:
+        return None
+    try:
+        img = Image.open(ICON_PATH).resize((64, 64), Image.LANCZOS)
+    except Exception:
+        return None
+    try:
+        img.save(ICON_CACHE, "PNG")
+    except Exception:
+        pass
+    return ImageTk.PhotoImage(img, master=master)
+
+# Helper: wake the log viewer when a watched log file changes
+class LogChangeHandler(FileSystemEventHandler):
+    def __init__(self, app, paths):
+        super().__init__()
+        self.app = app
+        self.paths = {os.path.abspath(p) for p in paths}
+
+    def on_modified(self, event):
+        if os.path.abspath(event.src_path) in self.paths:
+            self.app.after(0, self.app._drain_tail)
+
 # GUI App
 class OrganizerApp(tk.Tk):
     def __init__(self):
         super().__init__()
         self.title("Secure File Organizer — GUI")
-        # optionally set icon if pillow available and file exists
-        if Image and os.path.isfile(ICON_PATH):
-            try:
-                img = Image.open(ICON_PATH)
-                img = img.resize((64, 64))
-                self.icon_img = ImageTk.PhotoImage(img)
-                self.iconphoto(False, self.icon_img)
-            except Exception:
-                pass
+        # optionally set icon if the file exists (cached PNG, else resized via Pillow)
+        self.icon_img = load_icon(self)
+        if self.icon_img is not None:
+            self.iconphoto(False, self.icon_img)
 
         self.geometry("900x680")
         self.minsize(800, 600)
 
+        # one shared style for all app buttons
+        self.style = ttk.Style(self)
+        self.style.configure("App.TButton", padding=2)
+
         # Notebook (tabs)
         self.notebook = ttk.Notebook(self)
         self.notebook.pack(fill=tk.BOTH, expand=True)
@@ -103,164 +405,213 @@ class OrganizerApp(tk.Tk):
         self.notebook.add(self.tab_backups, text="Backups")
         self.notebook.add(self.tab_logs, text="Logs")
 
-        # Build tabs
+        # cached DirState per directory entry (existing dirs only), refreshed on Browse or when the path is edited
+        self._dir_states = {}
+
+        # Build tabs (each output tab reserves a slot for the shared output text)
+        self._output_slots = {}
         self.build_organizer_tab()
         self.build_integrity_tab()
         self.build_backups_tab()
         self.build_logs_tab()
+        self._build_shared_output()
 
-        # output streaming queue and thread handle
+        # restore progress queue and organizer/integrity thread handle
         self.out_queue = queue.Queue()
         self.proc_thread = None
 
+        # per-tag pending output, flushed by _flush_output
+        self._pending_out = {}
+        self._pending_len = {}
+        self._last_flush = {}
+        self._flush_scheduled = set()
+        self._progress_pct = {}
+        self._partial_line = {}
+        self._tag_lines = {}
+
+    # Shared widget builders
+    def _build_dir_picker(self, parent, row, label, var, browse_cb, pady=0):
+        ttk.Label(parent, text=label).grid(row=row, column=0, sticky=tk.W, pady=pady)
+        entry = ttk.Entry(parent, textvariable=var, width=70)
+        entry.grid(row=row, column=1, padx=6, pady=pady)
+        ttk.Button(parent, text="Browse", style="App.TButton", command=browse_cb).grid(row=row, column=2, pady=pady)
+        return entry
+
+    def _build_status_bar(self, frm, label, mode="indeterminate"):
+        statusfrm = ttk.Frame(frm)
+        statusfrm.pack(fill=tk.X, padx=10, pady=(6,6))
+        ttk.Label(statusfrm, text=label).pack(side=tk.LEFT)
+        var = tk.StringVar(value="Idle")
+        ttk.Label(statusfrm, textvariable=var).pack(side=tk.LEFT, padx=(6,0))
+        bar = ttk.Progressbar(statusfrm, mode=mode, maximum=100)
+        bar.pack(fill=tk.X, padx=6, pady=6)
+        return var, bar
+
+    def _build_scrolled(self, frm, widget_cls, **opts):
+        out_frame = ttk.Frame(frm)
+        out_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=6)
+        widget = widget_cls(out_frame, **opts)
+        widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        ybar = ttk.Scrollbar(out_frame, orient=tk.VERTICAL, command=widget.yview)
+        ybar.pack(side=tk.RIGHT, fill=tk.Y)
+        widget.configure(yscrollcommand=ybar.set)
+        return widget
+
+    def _build_output_slot(self, frm, tag):
+        """Reserve space in frm where the shared output text shows the tag stream."""
+        slot = ttk.Frame(frm)
+        slot.pack(fill=tk.BOTH, expand=True, padx=10, pady=6)
+        self._output_slots[str(frm)] = (slot, tag)
+
+    def _build_shared_output(self):
+        # child of the notebook so it can be packed into any tab's slot
+        self.shared_out = ttk.Frame(self.notebook)
+        self.text_shared = tk.Text(self.shared_out, wrap=tk.NONE)
+        self.text_shared.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        ybar = ttk.Scrollbar(self.shared_out, orient=tk.VERTICAL, command=self.text_shared.yview)
+        ybar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.text_shared.configure(yscrollcommand=ybar.set)
+        for tag in OUTPUT_TAGS:
+            self.text_shared.tag_configure(tag, elide=True)
+        self._active_output = None
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        self._on_tab_changed()
+
+    def _on_tab_changed(self, event=None):
+        self.shared_out.pack_forget()
+        entry = self._output_slots.get(self.notebook.select())
+        if entry is None:
+            self._active_output = None
+            return
+        slot, tag = entry
+        for t in OUTPUT_TAGS:
+            self.text_shared.tag_configure(t, elide=(t != tag))
+        self.shared_out.pack(in_=slot, fill=tk.BOTH, expand=True)
+        self._active_output = tag
+        self.text_shared.see(tk.END)
+
+    def _build_buttons(self, frm, buttons, pady=(6,6)):
+        """buttons: (text, command) pairs laid out left to right; returns the ttk.Buttons."""
+        btnfrm = ttk.Frame(frm)
+        btnfrm.pack(fill=tk.X, padx=10, pady=pady)
+        widgets = []
+        for col, (text, command) in enumerate(buttons):
+            btn = ttk.Button(btnfrm, text=text, style="App.TButton", command=command)
+            btn.grid(row=0, column=col, padx=4)
+            widgets.append(btn)
+        return btnfrm, widgets
+
     # Organizer Tab
     def build_organizer_tab(self):
         frm = self.tab_organize
 
         topfrm = ttk.Frame(frm)
         topfrm.pack(fill=tk.X, padx=10, pady=10)
-
-        # Source folder
-        ttk.Label(topfrm, text="Source Folder:").grid(row=0, column=0, sticky=tk.W)
         self.src_var = tk.StringVar()
-        self.src_entry = ttk.Entry(topfrm, textvariable=self.src_var, width=70)
-        self.src_entry.grid(row=0, column=1, padx=6)
-        ttk.Button(topfrm, text="Browse", command=self.browse_source).grid(row=0, column=2)
-
-        # Output folder
-        ttk.Label(topfrm, text="Organized Output Folder:").grid(row=1, column=0, sticky=tk.W, pady=(8,0))
+        self.src_entry = self._build_dir_picker(topfrm, 0, "Source Folder:", self.src_var, self.browse_source)
         self.out_var = tk.StringVar()
-        self.out_entry = ttk.Entry(topfrm, textvariable=self.out_var, width=70)
-        self.out_entry.grid(row=1, column=1, padx=6, pady=(8,0))
-        ttk.Button(topfrm, text="Browse", command=self.browse_output).grid(row=1, column=2, pady=(8,0))
+        self.out_entry = self._build_dir_picker(topfrm, 1, "Organized Output Folder:", self.out_var, self.browse_output, pady=(8,0))
 
         # Buttons
-        btnfrm = ttk.Frame(frm)
-        btnfrm.pack(fill=tk.X, padx=10, pady=(0,6))
-        self.run_btn = ttk.Button(btnfrm, text="Run Organizer", command=self.run_organizer)
-        self.run_btn.grid(row=0, column=0, padx=4)
-        ttk.Button(btnfrm, text="Open Output Folder", command=self.open_output_folder).grid(row=0, column=1, padx=4)
-        self.clear_btn = ttk.Button(btnfrm, text="Clear Output", command=self.clear_output_text)
-        self.clear_btn.grid(row=0, column=2, padx=4)
-
-        # Progress and status
-        statusfrm = ttk.Frame(frm)
-        statusfrm.pack(fill=tk.X, padx=10, pady=(6,6))
-        ttk.Label(statusfrm, text="Status:").pack(side=tk.LEFT)
-        self.status_var = tk.StringVar(value="Idle")
-        ttk.Label(statusfrm, textvariable=self.status_var).pack(side=tk.LEFT, padx=(6,0))
-        self.progress = ttk.Progressbar(statusfrm, mode="indeterminate")
-        self.progress.pack(fill=tk.X, padx=6, pady=6)
+        _, (self.run_btn, _, self.clear_btn) = self._build_buttons(frm, [
+            ("Run Organizer", self.run_organizer),
+            ("Open Output Folder", self.open_output_folder),
+            ("Clear Output", self.clear_output_text),
+        ], pady=(0,6))
 
-        # Output text area
-        out_frame = ttk.Frame(frm)
-        out_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=6)
-        self.text_out = tk.Text(out_frame, wrap=tk.NONE)
-        self.text_out.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        # scrollbars
-        ybar = ttk.Scrollbar(out_frame, orient=tk.VERTICAL, command=self.text_out.yview)
-        ybar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.text_out.configure(yscrollcommand=ybar.set)
+        # Progress, status and output
+        self.status_var, self.progress = self._build_status_bar(frm, "Status:")
+        self._build_output_slot(frm, "organizer")
 
     # Integrity Tab
     def build_integrity_tab(self):
         frm = self.tab_integrity
         topfrm = ttk.Frame(frm)
         topfrm.pack(fill=tk.X, padx=10, pady=10)
-
-        ttk.Label(topfrm, text="Organized Directory:").grid(row=0, column=0, sticky=tk.W)
         self.verify_dir_var = tk.StringVar()
-        self.verify_entry = ttk.Entry(topfrm, textvariable=self.verify_dir_var, width=70)
-        self.verify_entry.grid(row=0, column=1, padx=6)
-        ttk.Button(topfrm, text="Browse", command=self.browse_verify_dir).grid(row=0, column=2)
+        self.verify_entry = self._build_dir_picker(topfrm, 0, "Organized Directory:", self.verify_dir_var, self.browse_verify_dir)
 
-        btnfrm = ttk.Frame(frm)
-        btnfrm.pack(fill=tk.X, padx=10, pady=(0,6))
-        self.verify_btn = ttk.Button(btnfrm, text="Run Integrity Check", command=self.run_integrity)
-        self.verify_btn.grid(row=0, column=0, padx=4)
-        ttk.Button(btnfrm, text="Open Checksum Log", command=self.open_checksum_log).grid(row=0, column=1, padx=4)
-
-        # Progress and status
-        statusfrm = ttk.Frame(frm)
-        statusfrm.pack(fill=tk.X, padx=10, pady=(6,6))
-        ttk.Label(statusfrm, text="Integrity Status:").pack(side=tk.LEFT)
-        self.integrity_status = tk.StringVar(value="Idle")
-        ttk.Label(statusfrm, textvariable=self.integrity_status).pack(side=tk.LEFT, padx=(6,0))
-        self.integrity_progress = ttk.Progressbar(statusfrm, mode="indeterminate")
-        self.integrity_progress.pack(fill=tk.X, padx=6, pady=6)
+        btnfrm, (self.verify_btn, _) = self._build_buttons(frm, [
+            ("Run Integrity Check", self.run_integrity),
+            ("Open Checksum Log", self.open_checksum_log),
+        ], pady=(0,6))
+        self.use_py_verifier = tk.BooleanVar(value=False)
+        ttk.Checkbutton(btnfrm, text="Use Python verifier", variable=self.use_py_verifier).grid(row=0, column=2, padx=4)
 
-        # Output area
-        out_frame = ttk.Frame(frm)
-        out_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=6)
-        self.text_verify = tk.Text(out_frame, wrap=tk.NONE)
-        self.text_verify.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        ybar = ttk.Scrollbar(out_frame, orient=tk.VERTICAL, command=self.text_verify.yview)
-        ybar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.text_verify.configure(yscrollcommand=ybar.set)
+        self.integrity_status, self.integrity_progress = self._build_status_bar(frm, "Integrity Status:")
+        self._build_output_slot(frm, "integrity")
 
     # Backups Tab
     def build_backups_tab(self):
         frm = self.tab_backups
         topfrm = ttk.Frame(frm)
         topfrm.pack(fill=tk.X, padx=10, pady=10)
-
-        ttk.Label(topfrm, text="Organized Directory (for backups):").grid(row=0, column=0, sticky=tk.W)
         self.back_dir_var = tk.StringVar()
-        self.back_dir_entry = ttk.Entry(topfrm, textvariable=self.back_dir_var, width=70)
-        self.back_dir_entry.grid(row=0, column=1, padx=6)
-        ttk.Button(topfrm, text="Browse", command=self.browse_back_dir).grid(row=0, column=2)
+        self.back_dir_entry = self._build_dir_picker(topfrm, 0, "Organized Directory (for backups):", self.back_dir_var, self.browse_back_dir)
+
+        _, (_, self.restore_btn, self.cancel_restore_btn) = self._build_buttons(frm, [
+            ("Refresh Backups", self.refresh_backups),
+            ("Restore Selected Backup", self.restore_selected_backup),
+            ("Cancel Restore", self.cancel_restore),
+        ])
+        self.cancel_restore_btn.config(state=tk.DISABLED)
+
+        self.restore_status, self.restore_progress = self._build_status_bar(frm, "Restore Status:", mode="determinate")
+        self._restore_cancel = threading.Event()
+        self._restoring = False
+
+        self.backups_list = self._build_scrolled(frm, tk.Listbox)
 
-        btnfrm = ttk.Frame(frm)
-        btnfrm.pack(fill=tk.X, padx=10, pady=(6,6))
-        ttk.Button(btnfrm, text="Refresh Backups", command=self.refresh_backups).grid(row=0, column=0)
-        ttk.Button(btnfrm, text="Restore Selected Backup", command=self.restore_selected_backup).grid(row=0, column=1, padx=6)
-
-        listfrm = ttk.Frame(frm)
-        listfrm.pack(fill=tk.BOTH, expand=True, padx=10, pady=6)
-        self.backups_list = tk.Listbox(listfrm)
-        self.backups_list.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        ybar = ttk.Scrollbar(listfrm, orient=tk.VERTICAL, command=self.backups_list.yview)
-        ybar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.backups_list.configure(yscrollcommand=ybar.set)
     # Logs Tab
     def build_logs_tab(self):
         frm = self.tab_logs
         topfrm = ttk.Frame(frm)
         topfrm.pack(fill=tk.X, padx=10, pady=10)
-
-        ttk.Label(topfrm, text="Organized Directory (for logs):").grid(row=0, column=0, sticky=tk.W)
         self.log_dir_var = tk.StringVar()
-        self.log_dir_entry = ttk.Entry(topfrm, textvariable=self.log_dir_var, width=70)
-        self.log_dir_entry.grid(row=0, column=1, padx=6)
-        ttk.Button(topfrm, text="Browse", command=self.browse_log_dir).grid(row=0, column=2)
-
-        btnfrm = ttk.Frame(frm)
-        btnfrm.pack(fill=tk.X, padx=10, pady=(6,6))
-        ttk.Button(btnfrm, text="Start Live Logs", command=self.start_live_logs).grid(row=0, column=0)
-        ttk.Button(btnfrm, text="Stop Live Logs", command=self.stop_live_logs).grid(row=0, column=1, padx=6)
-        ttk.Button(btnfrm, text="Clear Log View", command=self.clear_log_view).grid(row=0, column=2, padx=6)
+        self.log_dir_entry = self._build_dir_picker(topfrm, 0, "Organized Directory (for logs):", self.log_dir_var, self.browse_log_dir)
 
-        out_frame = ttk.Frame(frm)
-        out_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=6)
-        self.text_logs = tk.Text(out_frame, wrap=tk.NONE)
-        self.text_logs.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        ybar = ttk.Scrollbar(out_frame, orient=tk.VERTICAL, command=self.text_logs.yview)
-        ybar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.text_logs.configure(yscrollcommand=ybar.set)
+        self._build_buttons(frm, [
+            ("Start Live Logs", self.start_live_logs),
+            ("Stop Live Logs", self.stop_live_logs),
+            ("Clear Log View", self.clear_log_view),
+        ])
+        self._build_output_slot(frm, "logs")
 
         self._live_logs_running = False
         self._live_log_paths = []
+        self._tail_files = {}
+        self._log_observer = None
 
     # Browse helpers
+    def _dir_state(self, key, path):
+        """
+        Cached DirState for key. Re-probed if path changed or the directory was
+        missing last time (it may have been created since); only existing
+        directories are cached.
+        """
+        state = self._dir_states.get(key)
+        if state is not None and state.path == path and state.exists:
+            return state
+        state = DirState.probe(path)
+        if state.exists:
+            self._dir_states[key] = state
+        else:
+            self._dir_states.pop(key, None)
+        return state
+
     def browse_source(self):
         p = filedialog.askdirectory(title="Select Source Folder")
         if p:
             self.src_var.set(p)
+            self._dir_states.pop("src", None)
+            self._dir_state("src", p)
 
     def browse_output(self):
         p = filedialog.askdirectory(title="Select Output Folder (existing) or Cancel to type new")
         if p:
             self.out_var.set(p)
+            self._dir_states.pop("out", None)
+            self._dir_state("out", p)
         else:
             # allow user to type a new path in the entry
             pass
@@ -279,6 +630,8 @@ class OrganizerApp(tk.Tk):
         p = filedialog.askdirectory(title="Select Organized Folder to Verify")
         if p:
             self.verify_dir_var.set(p)
+            self._dir_states.pop("verify", None)
+            self._dir_state("verify", p)
 
     def browse_back_dir(self):
         p = filedialog.askdirectory(title="Select Organized Folder (contains backups/)")
@@ -298,27 +651,27 @@ class OrganizerApp(tk.Tk):
         if not src or not out:
             messagebox.showwarning("Missing paths", "Please select both source and output folders.")
             return
-        if not os.path.isdir(src):
+        if not self._dir_state("src", src).exists:
             messagebox.showerror("Invalid source", f"Source folder does not exist: {src}")
             return
 
         # If output doesn't exist, create it
-        os.makedirs(out, exist_ok=True)
+        if not self._dir_state("out", out).exists:
+            os.makedirs(out, exist_ok=True)
+            self._dir_state("out", out)
 
         # disable UI controls
         self.run_btn.config(state=tk.DISABLED)
         self.status_var.set("Running organizer...")
-        self.progress.start(10)
+        self._start_progress(self.progress)
         self.clear_output_text()
 
-        # start thread to run script
+        # start script and stream its output
         cmd = [str(ORGANIZE_SCRIPT), src, out]
-        self.proc_thread = threading.Thread(target=self._background_run_and_stream, args=(cmd, self.text_out, self._organizer_complete))
-        self.proc_thread.daemon = True
-        self.proc_thread.start()
+        self._background_run_and_stream(cmd, "organizer", self._organizer_complete, self.progress)
 
     def _organizer_complete(self, returncode):
-        self.progress.stop()
+        self._stop_progress(self.progress)
         self.run_btn.config(state=tk.NORMAL)
         if returncode == 0:
             self.status_var.set("Organizer completed successfully")
@@ -332,22 +685,23 @@ class OrganizerApp(tk.Tk):
         if not d:
             messagebox.showwarning("Missing path", "Select organized directory to verify.")
             return
-        if not os.path.isdir(d):
+        if not self._dir_state("verify", d).exists:
             messagebox.showerror("Invalid directory", f"Directory does not exist: {d}")
             return
 
         self.verify_btn.config(state=tk.DISABLED)
         self.integrity_status.set("Running integrity check...")
-        self.integrity_progress.start(10)
-        self.text_verify.delete("1.0", tk.END)
+        self._start_progress(self.integrity_progress)
+        self._clear_output("integrity")
 
+        if self.use_py_verifier.get():
+            self._stream_from_thread(lambda ring: verify_checksums(d, ring), "integrity", self._integrity_complete, self.integrity_progress)
+            return
         cmd = [str(VERIFY_SCRIPT), d]
-        self.proc_thread = threading.Thread(target=self._background_run_and_stream, args=(cmd, self.text_verify, self._integrity_complete))
-        self.proc_thread.daemon = True
-        self.proc_thread.start()
+        self._background_run_and_stream(cmd, "integrity", self._integrity_complete, self.integrity_progress)
 
     def _integrity_complete(self, returncode):
-        self.integrity_progress.stop()
+        self._stop_progress(self.integrity_progress)
         self.verify_btn.config(state=tk.NORMAL)
         if returncode == 0:
             self.integrity_status.set("Integrity OK")
@@ -356,41 +710,193 @@ class OrganizerApp(tk.Tk):
             self.integrity_status.set("Integrity FAILED")
             messagebox.showwarning("Integrity", "Some files failed verification. Check logs.")
     # Background runner & stream
-    def _background_run_and_stream(self, cmd, text_widget, on_complete_cb):
-        q = queue.Queue()
+    def _background_run_and_stream(self, cmd, tag, on_complete_cb, progress_bar=None):
+        # POSIX: let Tk watch the pipe directly, no reader thread needed
+        if sys.platform != "win32" and hasattr(self.tk, "createfilehandler"):
+            try:
+                proc = spawn_process(cmd)
+            except OSError as e:
+                # missing script, or not executable (PermissionError)
+                self._queue_output(tag, f"[ERROR] Could not start script: {cmd[0]}\n{e}\n", force=True)
+                on_complete_cb(127)
+                return
+            os.set_blocking(proc.stdout.fileno(), False)
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            self.tk.createfilehandler(
+                proc.stdout, tk.READABLE,
+                lambda f, m: self._on_pipe_ready(proc, decoder, tag, on_complete_cb, progress_bar),
+            )
+            return
+
+        # Windows fallback: reader thread + ring buffer polled from Tk
+        self._stream_from_thread(lambda ring: run_process(cmd, ring), tag, on_complete_cb, progress_bar)
+
+    def _stream_from_thread(self, producer, tag, on_complete_cb, progress_bar=None):
+        """Run producer(ring) in a thread and stream what it pushes into the tag output."""
+        ring = SPSCByteRing()
+        result = []
         def worker():
-            rc = run_process(cmd, q)
-            q.put(None)  # sentinel
-            q.put(("__RC__", rc))
+            try:
+                rc = producer(ring)
+            except Exception as e:
+                ring.push(f"[ERROR] Running command failed: {e}\n".encode())
+                rc = 1
+            result.append(rc)
 
-        th = threading.Thread(target=worker, daemon=True)
-        th.start()
+        self.proc_thread = threading.Thread(target=worker, daemon=True)
+        self.proc_thread.start()
 
-        # periodically poll the queue and append to text_widget
+        # periodically drain the ring and append to the tag output
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
         def poll():
-            try:
-                while True:
-                    item = q.get_nowait()
-                    if item is None:
-                        # finished
-                        pass
-                    if isinstance(item, tuple) and item and item[0] == "__RC__":
-                        rc = item[1]
-                        on_complete_cb(rc)
-                        return
-                    if item is None:
-                        # sentinel - ignore
-                        continue
-                    text_widget.insert(tk.END, item)
-                    text_widget.see(tk.END)
-                    q.task_done()
-            except queue.Empty:
-                self.after(100, poll)
+            # check completion before draining so no trailing output is lost
+            finished = bool(result)
+            data = decoder.decode(ring.drain(), final=finished)
+            self._emit_output(tag, data, progress_bar, force=finished)
+            if finished:
+                on_complete_cb(result[0])
+                return
+            self.after(50, poll)
         self.after(100, poll)
 
+    def _on_pipe_ready(self, proc, decoder, tag, on_complete_cb, progress_bar=None):
+        fd = proc.stdout.fileno()
+        eof = False
+        error = ""
+        chunks = []
+        # bounded so a chatty script can't starve the Tk event loop
+        for _ in range(16):
+            try:
+                chunk = os.read(fd, PIPE_CHUNK)
+            except BlockingIOError:
+                break
+            except OSError as e:
+                error = f"[ERROR] Running command failed: {e}\n"
+                eof = True
+                break
+            if not chunk:
+                eof = True
+                break
+            chunks.append(chunk)
+        # raw bytes are decoded once per callback, not per read
+        data = decoder.decode(b"".join(chunks), final=eof) + error
+        if not eof:
+            self._emit_output(tag, data, progress_bar)
+            return
+        self.tk.deletefilehandler(proc.stdout)
+        proc.stdout.close()
+        self._emit_output(tag, data, progress_bar, force=True)
+        on_complete_cb(proc.wait())
+
+    # Progress bars
+    def _start_progress(self, bar):
+        self._progress_pct.pop(bar, None)
+        bar.configure(mode="indeterminate", value=0)
+        bar.start(PROGRESS_IDLE_MS)
+
+    def _stop_progress(self, bar):
+        bar.stop()
+        if bar in self._progress_pct:
+            bar["value"] = self._progress_pct[bar]
+
+    def _emit_output(self, tag, data, progress_bar=None, force=False):
+        """Strip PROGRESS lines from data into progress_bar, queue the rest for the tag output."""
+        if progress_bar is not None:
+            # only whole lines are matched; the unfinished tail waits for more data (or EOF)
+            data = self._partial_line.pop(tag, "") + data
+            if not force:
+                idx = data.rfind("\n")
+                if idx + 1 < len(data):
+                    self._partial_line[tag] = data[idx + 1:]
+                    data = data[:idx + 1]
+        if progress_bar is not None and data:
+            matches = PROGRESS_RE.findall(data)
+            if matches:
+                data = PROGRESS_RE.sub("", data)
+                done, total = (int(x) for x in matches[-1])
+                if total:
+                    if progress_bar not in self._progress_pct:
+                        progress_bar.stop()
+                        progress_bar.configure(mode="determinate", maximum=100)
+                    pct = min(done * 100 // total, 100)
+                    if pct != self._progress_pct.get(progress_bar):
+                        self._progress_pct[progress_bar] = pct
+                        progress_bar["value"] = pct
+        self._queue_output(tag, data, force=force)
+
+    # Debounced text output
+    def _queue_output(self, tag, data, force=False):
+        """Buffer data for the tag output and schedule one flush: on idle if due, else when FLUSH_INTERVAL elapses."""
+        if data:
+            self._pending_out.setdefault(tag, []).append(data)
+            self._pending_len[tag] = self._pending_len.get(tag, 0) + len(data)
+        if not self._pending_out.get(tag):
+            return
+        if force:
+            self._flush_output(tag)
+            return
+        if tag in self._flush_scheduled:
+            return
+        self._flush_scheduled.add(tag)
+        remaining = FLUSH_INTERVAL - (time.monotonic() - self._last_flush.get(tag, 0.0))
+        if remaining <= 0 or self._pending_len[tag] >= FLUSH_BYTES:
+            self.after_idle(self._flush_output, tag)
+        else:
+            # trailing flush, so output isn't held until the next write arrives
+            self.after(int(remaining * 1000) + 1, self._flush_output, tag)
+
+    def _flush_output(self, tag):
+        self._flush_scheduled.discard(tag)
+        buf = self._pending_out.get(tag)
+        if not buf:
+            return
+        self._append_capped(tag, "".join(buf))
+        buf.clear()
+        self._pending_len[tag] = 0
+        self._last_flush[tag] = time.monotonic()
+
+    def _append_capped(self, tag, s):
+        """Append s to the tag output and drop its oldest lines past TEXT_MAX_LINES."""
+        text = self.text_shared
+        text.insert(tk.END, s, tag)
+        self._tag_lines[tag] = self._tag_lines.get(tag, 0) + s.count("\n")
+        if self._tag_lines[tag] > TEXT_MAX_LINES:
+            self._trim_tag(tag, self._tag_lines[tag] - TEXT_KEEP_LINES)
+        # hidden streams need no scrolling
+        if tag == self._active_output:
+            text.see(tk.END)
+
+    def _trim_tag(self, tag, excess):
+        """Delete the oldest excess lines of the tag stream, leaving other streams untouched."""
+        text = self.text_shared
+        ranges = text.tag_ranges(tag)
+        cuts = []
+        need = excess
+        for i in range(0, len(ranges), 2):
+            if need <= 0:
+                break
+            start, end = str(ranges[i]), str(ranges[i + 1])
+            n = int(end.split(".")[0]) - int(start.split(".")[0])
+            if n <= need:
+                cuts.append((start, end))
+                need -= n
+            else:
+                cuts.append((start, f"{start} + {need} lines linestart"))
+                need = 0
+        # delete back to front so earlier indices stay valid
+        for start, end in reversed(cuts):
+            text.delete(start, end)
+        self._tag_lines[tag] -= excess - need
+
+    def _clear_output(self, tag):
+        ranges = self.text_shared.tag_ranges(tag)
+        for i in range(len(ranges) - 2, -1, -2):
+            self.text_shared.delete(ranges[i], ranges[i + 1])
+        self._tag_lines[tag] = 0
+
     # Clear output
     def clear_output_text(self):
-        self.text_out.delete("1.0", tk.END)
+        self._clear_output("organizer")
 
     # Open checksum log
     def open_checksum_log(self):
@@ -410,16 +916,22 @@ class OrganizerApp(tk.Tk):
     # Backups list & restore
     def refresh_backups(self):
         d = self.back_dir_var.get().strip()
+        entries = []
+        if d:
+            # backup_<timestamp>.zip names sort chronologically, so no stat() needed;
+            # a missing backups/ just surfaces as an error from scandir
+            try:
+                with os.scandir(os.path.join(d, "backups")) as it:
+                    entries = heapq.nlargest(
+                        BACKUP_LIST_LIMIT,
+                        (e.name for e in it if e.name.endswith(ZIP_SUFFIXES) and e.is_file()),
+                    )
+            except (FileNotFoundError, NotADirectoryError):
+                pass
+        # repopulate in one delete + one insert
         self.backups_list.delete(0, tk.END)
-        if not d:
-            return
-        backups_dir = os.path.join(d, "backups")
-        if not os.path.isdir(backups_dir):
-            return
-        files = sorted(os.listdir(backups_dir), reverse=True)
-        for f in files:
-            if f.lower().endswith(".zip"):
-                self.backups_list.insert(tk.END, f)
+        if entries:
+            self.backups_list.insert(tk.END, *entries)
 
     def restore_selected_backup(self):
         sel = self.backups_list.curselection()
@@ -443,58 +955,151 @@ class OrganizerApp(tk.Tk):
         if not messagebox.askyesno("Confirm restore", f"Restore {name} into {dest}? This may overwrite files."):
             return
 
+        # extract in a worker thread so the GUI stays responsive
+        self.restore_btn.config(state=tk.DISABLED)
+        self.cancel_restore_btn.config(state=tk.NORMAL)
+        self.restore_status.set(f"Restoring {name}...")
+        self.restore_progress["value"] = 0
+        self._restore_cancel.clear()
+        self._restoring = True
+        threading.Thread(target=self._restore_worker, args=(backup_path, dest), daemon=True).start()
+        self.after(100, self._poll_restore)
+
+    def _restore_worker(self, backup_path, dest):
+        error = None
+        cancelled = False
         try:
             with zipfile.ZipFile(backup_path, 'r') as z:
-                z.extractall(dest)
-            messagebox.showinfo("Restored", f"Backup restored into {dest}")
+                infos = z.infolist()
+                total = sum(i.file_size for i in infos) or 1
+                # resolve every target before writing, so an unsafe archive is rejected up front
+                root = os.path.realpath(dest)
+                targets = [member_target(info, root) for info in infos]
+                done = 0
+                for info, target in zip(infos, targets):
+                    if self._restore_cancel.is_set():
+                        cancelled = True
+                        break
+                    if target is not None:
+                        extract_member(z, info, target)
+                    done += info.file_size
+                    self.out_queue.put(done * 100 // total)
         except Exception as e:
-            messagebox.showerror("Restore failed", f"Failed to restore: {e}")
+            error = e
+        self.after(0, self._restore_complete, dest, error, cancelled)
+
+    def _poll_restore(self):
+        pct = None
+        try:
+            while True:
+                pct = self.out_queue.get_nowait()
+        except queue.Empty:
+            pass
+        if pct is not None:
+            self.restore_progress["value"] = pct
+        if self._restoring:
+            self.after(100, self._poll_restore)
+
+    def cancel_restore(self):
+        self._restore_cancel.set()
+
+    def _restore_complete(self, dest, error, cancelled):
+        self._restoring = False
+        self._poll_restore()
+        self.restore_btn.config(state=tk.NORMAL)
+        self.cancel_restore_btn.config(state=tk.DISABLED)
+        if error is not None:
+            self.restore_status.set("Restore failed")
+            messagebox.showerror("Restore failed", f"Failed to restore: {error}")
+        elif cancelled:
+            self.restore_status.set("Restore cancelled")
+            messagebox.showwarning("Restore cancelled", f"Restore into {dest} was cancelled; some files may already have been extracted.")
+        else:
+            self.restore_status.set("Restore completed")
+            messagebox.showinfo("Restored", f"Backup restored into {dest}")
     # Live logs
     def start_live_logs(self):
         d = self.log_dir_var.get().strip()
         if not d:
             messagebox.showwarning("Select directory", "Select organized directory to read logs from.")
             return
-        organizer_log = os.path.join(d, "organizer.log")
-        integrity_log = os.path.join(d, "integrity_check.log")
-        paths = []
-        if os.path.isfile(organizer_log):
-            paths.append(organizer_log)
-        if os.path.isfile(integrity_log):
-            paths.append(integrity_log)
-        if not paths:
+        # opening is the existence check, no separate stat() per log
+        files = {}
+        for name in ("organizer.log", "integrity_check.log"):
+            p = os.path.join(d, name)
+            try:
+                files[p] = open(p, 'rb')
+            except OSError:
+                pass
+        if not files:
             messagebox.showwarning("No logs", "No log files found in the selected directory.")
             return
+        self._stop_log_observer()
+        self._close_tail_files()
+        paths = list(files)
+        self._tail_files = files
         self._live_log_paths = paths
         self._live_logs_running = True
-        self.text_logs.delete("1.0", tk.END)
-        self._tail_positions = {p: 0 for p in paths}
-        self._do_tail()
+        self._clear_output("logs")
+        self._drain_tail()
+        if Observer is not None:
+            try:
+                self._log_observer = Observer()
+                self._log_observer.schedule(LogChangeHandler(self, paths), d, recursive=False)
+                self._log_observer.start()
+                return
+            except Exception:
+                self._log_observer = None
+        self.after(LOG_POLL_MS, self._do_tail)
 
     def _do_tail(self):
+        # polling fallback when watchdog is unavailable
+        if not self._live_logs_running:
+            return
+        self._drain_tail()
+        self.after(LOG_POLL_MS, self._do_tail)
+
+    def _drain_tail(self):
         if not self._live_logs_running:
             return
         parts = []
-        for p in self._live_log_paths:
+        for p, fh in self._tail_files.items():
             try:
-                with open(p, 'r') as fh:
-                    fh.seek(self._tail_positions.get(p, 0))
-                    data = fh.read()
-                    if data:
-                        parts.append(f"--- {os.path.basename(p)} ---\n{data}\n")
-                    self._tail_positions[p] = fh.tell()
+                st = os.fstat(fh.fileno())
+                pos = fh.tell()
+                if st.st_size == pos:
+                    continue
+                if st.st_size < pos:
+                    # log was truncated; start over
+                    fh.seek(0)
+                data = fh.read().decode('utf-8', errors='replace')
+                if data:
+                    parts.append(f"--- {os.path.basename(p)} ---\n{data}\n")
             except Exception:
                 pass
         if parts:
-            self.text_logs.insert(tk.END, "\n".join(parts))
-            self.text_logs.see(tk.END)
-        self.after(LOG_POLL_MS, self._do_tail)
+            self._append_capped("logs", "\n".join(parts))
 
     def stop_live_logs(self):
         self._live_logs_running = False
+        self._stop_log_observer()
+        self._close_tail_files()
+
+    def _stop_log_observer(self):
+        if self._log_observer is not None:
+            self._log_observer.stop()
+            self._log_observer = None
+
+    def _close_tail_files(self):
+        for fh in self._tail_files.values():
+            try:
+                fh.close()
+            except OSError:
+                pass
+        self._tail_files = {}
 
     def clear_log_view(self):
-        self.text_logs.delete("1.0", tk.END)
+        self._clear_output("logs")
 # Entry point
 def main():
     # quick checks
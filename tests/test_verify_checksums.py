@@ -0,0 +1,51 @@
+import hashlib
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import organizer_gui as gui
+
+
+class VerifyChecksumsTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.dir = self._tmp.name
+        self.log = os.path.join(self.dir, "organized_files_checksum.log")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def write_log(self, text):
+        with open(self.log, "w") as fh:
+            fh.write(text)
+
+    def test_garbage_manifest_fails(self):
+        self.write_log("not a checksum line\nanother bad line\n")
+        self.assertEqual(gui.read_checksum_log(self.log), ([], 2))
+        ring = gui.SPSCByteRing()
+        self.assertEqual(gui.verify_checksums(self.dir, ring), 1)
+        out = ring.drain().decode()
+        self.assertIn("WARNING: 2 lines are improperly formatted", out)
+        self.assertIn("no properly formatted checksum lines found", out)
+        self.assertNotIn("Integrity OK", out)
+
+    def test_empty_manifest_fails(self):
+        self.write_log("")
+        self.assertEqual(gui.verify_checksums(self.dir, gui.SPSCByteRing()), 1)
+
+    def test_bad_lines_are_counted_alongside_valid_ones(self):
+        path = os.path.join(self.dir, "a.txt")
+        with open(path, "wb") as fh:
+            fh.write(b"hello")
+        digest = hashlib.sha256(b"hello").hexdigest()
+        self.write_log(f"{digest}  {path}\n{'z' * 64}  {path}\n")
+        entries, bad = gui.read_checksum_log(self.log)
+        self.assertEqual(entries, [(digest, path)])
+        self.assertEqual(bad, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()